@@ -92,9 +92,12 @@ fi
 git add -A
 
 # Stage-level scan (additional check)
-if git diff --cached --name-only | xargs -I {} grep -qE "$SECRET_PATTERN" {} 2>/dev/null; then
+# Single batched pass: the matching paths decide the abort and are reported as-is
+STAGED_SECRETS=$(git diff --cached --name-only --diff-filter=d -z | xargs -0 -r grep -lE "$SECRET_PATTERN" 2>/dev/null || true)
+
+if [[ -n "$STAGED_SECRETS" ]]; then
     echo "Error: Potential secret detected in staged files. Aborting."
-    git diff --cached --name-only | xargs -I {} grep -lE "$SECRET_PATTERN" {} 2>/dev/null || true
+    echo "$STAGED_SECRETS"
     git reset
     exit 1
 fi
@@ -1,26 +1,34 @@
 #!/usr/bin/env python3
 """Tests for clawsync"""
+import os
 import pytest
 from pathlib import Path
 
 DIR = Path(__file__).parent
 
-def test_has_sync_script():
+@pytest.fixture(scope="module")
+def entries():
+    """Repo root entries, listed once with a single scandir"""
+    with os.scandir(DIR) as it:
+        return {e.name: e for e in it}
+
+def test_has_sync_script(entries):
     """Test sync.sh exists"""
-    assert (DIR / "sync.sh").exists()
+    assert "sync.sh" in entries
 
-def test_has_restore_script():
+def test_has_restore_script(entries):
     """Test restore.sh exists"""
-    assert (DIR / "restore.sh").exists()
+    assert "restore.sh" in entries
 
-def test_has_skill():
+def test_has_skill(entries):
     """Test SKILL.md exists"""
-    assert (DIR / "SKILL.md").exists()
+    assert "SKILL.md" in entries
 
-def test_has_github_workflow():
+def test_has_github_workflow(entries):
     """Test .github/workflows exists"""
-    assert (DIR / ".github").is_dir()
+    entry = entries.get(".github")
+    assert entry is not None and entry.is_dir()
 
-def test_has_gitignore():
+def test_has_gitignore(entries):
     """Test .gitignore exists"""
-    assert (DIR / ".gitignore").exists()
+    assert ".gitignore" in entries